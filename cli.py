@@ -0,0 +1,240 @@
+import argparse
+import contextlib
+import importlib.util
+import random
+import time
+
+from minesweeper import Minesweeper, MinesweeperAI
+from replay import GameRecorder, GameReplayer, load_games
+
+
+def play_game(height, width, mines, seed, recorder=None):
+    """
+    Plays a single game of Minesweeper with the AI, without rendering anything.
+
+    The AI makes a safe move whenever one is known and a random move otherwise, until
+    it reveals a mine, uncovers every safe cell, or runs out of moves. It then flags
+    every mine it has deduced.
+
+    Args:
+        height (int): The height of the game board.
+        width (int): The width of the game board.
+        mines (int): The number of mines on the board.
+        seed (int): The seed used to place the mines.
+        recorder (GameRecorder): Optional recorder to stream the game to.
+
+    Returns:
+        tuple: A (won, moves) pair, where won is True if every safe cell was uncovered
+            and moves is the number of cells the AI revealed.
+    """
+    random.seed(seed)
+    game = Minesweeper(height=height, width=width, mines=mines)
+    ai = MinesweeperAI(height=height, width=width)
+    safe_cells = height * width - mines
+    if recorder is not None:
+        recorder.start_game(seed, height, width, mines)
+
+    lost = False
+    while len(ai.moves_made) < safe_cells:
+        reason = "safe"
+        move = ai.make_safe_move()
+        if move is None:
+            reason = "random"
+            move = ai.make_random_move()
+            if move is None:
+                break
+
+        if recorder is not None:
+            recorder.record_move(move, reason)
+        if game.is_mine(move):
+            lost = True
+            break
+        ai.add_knowledge(move, game.nearby_mines(move))
+
+    # Flag the mines the AI has deduced
+    if not lost:
+        for cell in sorted(ai.mines):
+            if recorder is not None:
+                recorder.record_move(cell, "flag")
+            game.mines_found.add(cell)
+
+    won = not lost and len(ai.moves_made) == safe_cells
+    if recorder is not None:
+        recorder.end_game(won)
+    return won, len(ai.moves_made)
+
+
+def play_games(args):
+    """
+    Lets the AI play the requested number of headless games and prints a summary.
+
+    Args:
+        args (Namespace): The parsed command-line arguments.
+    """
+    # Each game gets its own seed so any single game can be reproduced
+    base_seed = args.seed if args.seed is not None else random.randrange(2**32)
+    wins = 0
+    start = time.perf_counter()
+    with (
+        GameRecorder(args.record) if args.record else contextlib.nullcontext()
+    ) as recorder:
+        for n in range(args.games):
+            seed = base_seed + n
+            won, moves = play_game(args.height, args.width, args.mines, seed, recorder)
+            wins += won
+            print(
+                f"Game {n + 1}: {'won' if won else 'lost'} after {moves} moves (seed {seed})"
+            )
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Won {wins}/{args.games} games ({100 * wins / args.games:.1f}%) in {elapsed:.3f} s"
+    )
+
+
+def replay_game(args):
+    """
+    Fast-forwards a recorded game to the requested move and prints its state.
+
+    Args:
+        args (Namespace): The parsed command-line arguments.
+    """
+    replayer = GameReplayer(args.log)
+    move = len(replayer) if args.move is None else args.move
+    state = replayer.seek(move)
+
+    print(
+        f"Game {args.game + 1} ({replayer.height}x{replayer.width}, "
+        f"{replayer.mines} mines, seed {replayer.seed}): {replayer.result or 'unfinished'}"
+    )
+    if state.index > 0:
+        cell, reason, elapsed = replayer.moves[state.index - 1]
+        print(f"Move {state.index}/{len(replayer)}: {reason} {cell} at {elapsed:.6f} s")
+    print(
+        f"Revealed {len(state.revealed)} cells, flagged {len(state.flags)}, "
+        f"{'lost' if state.lost else 'no mine hit'}"
+    )
+    print(f"AI knows {len(state.ai.safes)} safe cells and {len(state.ai.mines)} mines")
+
+
+def parse_args(argv=None):
+    """
+    Parses the command-line arguments.
+
+    Args:
+        argv (list of str): The arguments to parse (default is sys.argv[1:]).
+
+    Returns:
+        Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Play Minesweeper, with or without a window."
+    )
+    parser.add_argument("--height", type=int, help="height of the board (default: 8)")
+    parser.add_argument("--width", type=int, help="width of the board (default: 8)")
+    parser.add_argument("--mines", type=int, help="number of mines (default: 10)")
+    parser.add_argument("--seed", type=int, help="seed used to place the mines")
+    parser.add_argument(
+        "--games",
+        type=int,
+        help="number of headless games to play (default: 1)",
+    )
+    parser.add_argument("--record", metavar="PATH", help="append played games to a log")
+    parser.add_argument("--replay", metavar="PATH", help="replay a game from a log")
+    parser.add_argument(
+        "--game",
+        type=int,
+        default=0,
+        help="index of the game to replay from the log (default: 0)",
+    )
+    parser.add_argument(
+        "--move", type=int, help="move to jump to when replaying (default: the end)"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--headless",
+        dest="gui",
+        action="store_false",
+        help="let the AI play without a window (default)",
+    )
+    mode.add_argument(
+        "--gui", dest="gui", action="store_true", help="open the Pygame window"
+    )
+    parser.set_defaults(gui=False)
+    args = parser.parse_args(argv)
+
+    # Reject options that the selected mode would otherwise ignore
+    if args.gui and args.games is not None:
+        parser.error("--games only applies to headless games, not --gui")
+    if args.replay and any(
+        value is not None for value in (args.height, args.width, args.mines, args.seed)
+    ):
+        parser.error(
+            "--height, --width, --mines and --seed come from the log with --replay"
+        )
+    if args.gui and importlib.util.find_spec("pygame") is None:
+        parser.error("pygame is required for --gui")
+
+    # Fill in the defaults only now, so the checks above can tell what was given
+    args.height = 8 if args.height is None else args.height
+    args.width = 8 if args.width is None else args.width
+    args.mines = 10 if args.mines is None else args.mines
+    args.games = 1 if args.games is None else args.games
+
+    if args.height < 1 or args.width < 1:
+        parser.error("the board must be at least 1x1")
+    if not 0 <= args.mines < args.height * args.width:
+        parser.error(
+            "the number of mines must be between 0 and the number of cells minus one"
+        )
+    if args.games < 1:
+        parser.error("the number of games must be at least 1")
+    if args.record and (args.gui or args.replay):
+        parser.error("--record only applies to headless games, not --gui or --replay")
+    if args.game < 0 or (args.move is not None and args.move < 0):
+        parser.error("the game and move indexes must not be negative")
+
+    # Load the game to replay so problems with the log are reported up front
+    args.log = None
+    if args.replay:
+        try:
+            games = load_games(args.replay)
+        except (OSError, ValueError) as error:
+            parser.error(f"cannot read {args.replay}: {error}")
+        if args.game >= len(games):
+            parser.error(f"{args.replay} only contains {len(games)} games")
+        args.log = games[args.game]
+        if args.move is not None and args.move > len(args.log["moves"]):
+            parser.error(f"game {args.game} only has {len(args.log['moves'])} moves")
+    return args
+
+
+def main(argv=None):
+    """
+    Runs the command-line entry point.
+
+    In headless mode the AI plays the requested number of games and a summary is printed,
+    or a recorded game is fast-forwarded when a log is given to replay.
+    Pygame is only imported, and its assets only loaded, when the GUI is selected.
+
+    Args:
+        argv (list of str): The arguments to parse (default is sys.argv[1:]).
+    """
+    args = parse_args(argv)
+
+    if args.gui:
+        import runner
+
+        if args.replay:
+            replayer = GameReplayer(args.log)
+            runner.main(replay=replayer, start=args.move or 0)
+        else:
+            runner.main(settings=(args.height, args.width, args.mines), seed=args.seed)
+    elif args.replay:
+        replay_game(args)
+    else:
+        play_games(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 import random
 
+from patterns import MINE, SAFE, lookup
+
+# Cells around each cell, shared by every AI playing on a board of the same size
+NEIGHBOR_CACHES = {}
+
 
 class Minesweeper:
     """
@@ -226,6 +231,7 @@ class MinesweeperAI:
         mines (set of tuples): A set containing the coordinates of discovered mines.
         safes (set of tuples): A set containing the coordinates of discovered safe cells.
         knowledge (list of Sentences): A list of Sentences representing the AI's knowledge about the game.
+        counts (dict): Maps each revealed cell to the number of mines surrounding it.
     """
 
     def __init__(self, height=8, width=8):
@@ -250,6 +256,9 @@ class MinesweeperAI:
         # List of sentences about the game known to be true
         self.knowledge = []
 
+        # Mine counts of the cells revealed so far
+        self.counts = {}
+
     def mark_mine(self, cell):
         """
         Marks a cell as a mine in the AI's knowledge base.
@@ -289,15 +298,13 @@ class MinesweeperAI:
             cell (tuple): The coordinates (i, j) of the cell that was revealed.
             count (int): The number of mines surrounding the revealed cell.
         """
+        was_safe = cell in self.safes
         self.moves_made.add(cell)
+        self.counts[cell] = count
         self.mark_safe(cell)
 
         # Gather all neighboring cells
-        neighbors = set()
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-                if (i, j) != cell and 0 <= i < self.height and 0 <= j < self.width:
-                    neighbors.add((i, j))
+        neighbors = set(self.neighbors(cell))
 
         # Remove known mines and adjust count
         known_mines = set()
@@ -312,10 +319,110 @@ class MinesweeperAI:
         neighbors -= self.safes
 
         # Add the new sentence
-        self.knowledge.append(Sentence(neighbors, count))
+        if neighbors:
+            self.knowledge.append(Sentence(neighbors, count))
+
+        # Apply known local patterns first. If the cell was already known to be safe
+        # and nothing new was learned, the knowledge base is unchanged and general
+        # inference would find nothing more.
+        marked = self.apply_patterns(cell)
+        if neighbors or marked or not was_safe:
+            self.update_knowledge()
+
+    def neighbors(self, cell, distance=1):
+        """
+        Gathers the cells around a given cell.
+
+        Args:
+            cell (tuple): A tuple (i, j) representing the cell coordinates.
+            distance (int): How many rows and columns away to look (default is 1).
+
+        Returns:
+            frozenset: A set of tuples representing the coordinates of the cells in
+                bounds within the given distance, excluding the cell itself.
+        """
+        cache = NEIGHBOR_CACHES.setdefault((self.height, self.width), {})
+        key = (cell, distance)
+        if key not in cache:
+            neighbors = set()
+            for i in range(cell[0] - distance, cell[0] + distance + 1):
+                for j in range(cell[1] - distance, cell[1] + distance + 1):
+                    if (i, j) != cell and 0 <= i < self.height and 0 <= j < self.width:
+                        neighbors.add((i, j))
+            cache[key] = frozenset(neighbors)
+        return cache[key]
+
+    def constraint(self, cell):
+        """
+        Determines what is still unknown around a revealed cell.
+
+        Args:
+            cell (tuple): The coordinates (i, j) of a revealed cell.
+
+        Returns:
+            tuple: A (cells, count) pair, where cells is the set of neighboring cells
+                not yet known to be safe or mines and count is the number of mines
+                among them.
+        """
+        neighbors = self.neighbors(cell)
+        cells = neighbors - self.mines - self.safes
+        return cells, self.counts[cell] - len(neighbors & self.mines)
+
+    def apply_patterns(self, cell):
+        """
+        Marks the safes and mines that follow from local patterns around a revealed cell.
+
+        Each pair of nearby revealed cells whose unknown neighbors overlap is looked up
+        in the precomputed pattern table. Whenever this marks new cells, the revealed
+        cells around them are checked in turn.
+
+        Args:
+            cell (tuple): The coordinates (i, j) of the newly revealed cell.
+
+        Returns:
+            bool: True if any cell was marked as safe or as a mine, False otherwise.
+        """
+        found = False
+        queue = [cell]
+        while queue:
+            a = queue.pop()
+            cells_a, count_a = self.constraint(a)
+            if not cells_a:
+                continue
+
+            for b in self.neighbors(a, distance=2) & self.moves_made:
+                if cells_a.isdisjoint(self.neighbors(b)):
+                    continue
+                cells_b, count_b = self.constraint(b)
+                both = cells_a & cells_b
+                if not both:
+                    continue
 
-        # Update the knowledge base
-        self.update_knowledge()
+                regions = (cells_a - both, both, cells_b - both)
+                conclusions = lookup(
+                    len(regions[0]), len(both), len(regions[2]), count_a, count_b
+                )
+                marked = set()
+                for region, conclusion in zip(regions, conclusions):
+                    if conclusion == SAFE:
+                        for safe in region:
+                            self.mark_safe(safe)
+                    elif conclusion == MINE:
+                        for mine in region:
+                            self.mark_mine(mine)
+                    else:
+                        continue
+                    marked |= region
+
+                # Check the revealed cells around the newly marked ones, this one included
+                if marked:
+                    found = True
+                    for marked_cell in marked:
+                        queue.extend(self.neighbors(marked_cell) & self.moves_made)
+                    queue.append(a)
+                    break
+
+        return found
 
     def update_knowledge(self):
         """
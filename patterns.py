@@ -0,0 +1,189 @@
+import os
+import struct
+import zlib
+
+# Largest number of unknown cells, or mines, around a revealed cell
+MAX_CELLS = 8
+SIZE = MAX_CELLS + 1
+
+# Conclusions the table can hold for a region of cells
+UNKNOWN = 0
+SAFE = 1
+MINE = 2
+
+# Where the table is cached between runs
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "minesweeper"
+)
+CACHE_PATH = os.path.join(CACHE_DIR, "patterns.bin")
+
+# Header of the cache file: magic, version and CRC-32 of the table. Bump the version
+# if the encoding changes.
+CACHE_MAGIC = b"MSPT"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct(">4sHI")
+
+# The table, once built or loaded
+_table = None
+
+
+def index(only_a, both, only_b, count_a, count_b):
+    """
+    Computes the position of a pattern in the table.
+
+    Args:
+        only_a (int): The number of unknown cells next to the first cell only.
+        both (int): The number of unknown cells next to both cells.
+        only_b (int): The number of unknown cells next to the second cell only.
+        count_a (int): The number of mines left around the first cell.
+        count_b (int): The number of mines left around the second cell.
+
+    Returns:
+        int: The index of the pattern in the table.
+    """
+    return (((only_a * SIZE + both) * SIZE + only_b) * SIZE + count_a) * SIZE + count_b
+
+
+def conclude(only_a, both, only_b, count_a, count_b):
+    """
+    Works out what is known about each region of a pattern.
+
+    Two revealed cells whose unknown neighbors overlap split those neighbors into three
+    regions. Every possible number of mines in the shared region is tried, and a region
+    is safe or mined if it is so in every arrangement consistent with both counts.
+
+    Args:
+        only_a (int): The number of unknown cells next to the first cell only.
+        both (int): The number of unknown cells next to both cells.
+        only_b (int): The number of unknown cells next to the second cell only.
+        count_a (int): The number of mines left around the first cell.
+        count_b (int): The number of mines left around the second cell.
+
+    Returns:
+        int: The conclusions for the three regions, two bits each, or 0 if nothing
+            can be concluded or the counts are inconsistent.
+    """
+    low = max(0, count_a - only_a, count_b - only_b)
+    high = min(both, count_a, count_b)
+    if low > high:
+        return 0
+
+    # Mines in each region for the fewest and most mines in the shared region
+    regions = [
+        (only_a, count_a - high, count_a - low),
+        (both, low, high),
+        (only_b, count_b - high, count_b - low),
+    ]
+    result = 0
+    for shift, (cells, fewest, most) in zip((0, 2, 4), regions):
+        if cells == 0:
+            continue
+        if most == 0:
+            result |= SAFE << shift
+        elif fewest == cells:
+            result |= MINE << shift
+    return result
+
+
+def build_table():
+    """
+    Builds the table of conclusions for every pattern.
+
+    Returns:
+        bytes: One byte per pattern, in the order given by index.
+    """
+    table = bytearray(SIZE**5)
+    for only_a in range(SIZE):
+        for both in range(SIZE - only_a):
+            for only_b in range(SIZE - both):
+                for count_a in range(only_a + both + 1):
+                    for count_b in range(both + only_b + 1):
+                        i = index(only_a, both, only_b, count_a, count_b)
+                        table[i] = conclude(only_a, both, only_b, count_a, count_b)
+    return bytes(table)
+
+
+def cache_header(table):
+    """
+    Builds the header written in front of the table in the cache file.
+
+    Args:
+        table (bytes): The table of conclusions.
+
+    Returns:
+        bytes: The magic, version and CRC-32 checksum of the table.
+    """
+    return CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, zlib.crc32(table))
+
+
+def load_table(path=CACHE_PATH):
+    """
+    Loads the table from the cache, building and caching it if it is missing or invalid.
+
+    The cache is only trusted if its header has the expected magic and version and the
+    checksum matches the table. Failing to write the cache is not an error; the table
+    is simply rebuilt next time.
+
+    Args:
+        path (str): The path of the cache file (default is CACHE_PATH).
+
+    Returns:
+        bytes: The table of conclusions.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+        header, table = data[: CACHE_HEADER.size], data[CACHE_HEADER.size :]
+        if len(table) == SIZE**5 and header == cache_header(table):
+            return table
+    except OSError:
+        pass
+
+    table = build_table()
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as file:
+            file.write(cache_header(table))
+            file.write(table)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return table
+
+
+def get_table():
+    """
+    Returns the table, loading it the first time it is needed.
+
+    Returns:
+        bytes: The table of conclusions.
+    """
+    global _table
+    if _table is None:
+        _table = load_table()
+    return _table
+
+
+def lookup(only_a, both, only_b, count_a, count_b):
+    """
+    Looks up what is known about each region of a pattern.
+
+    Args:
+        only_a (int): The number of unknown cells next to the first cell only.
+        both (int): The number of unknown cells next to both cells.
+        only_b (int): The number of unknown cells next to the second cell only.
+        count_a (int): The number of mines left around the first cell.
+        count_b (int): The number of mines left around the second cell.
+
+    Returns:
+        tuple: The conclusion (UNKNOWN, SAFE or MINE) for the cells next to the first
+            cell only, next to both cells, and next to the second cell only.
+    """
+    if not (0 <= count_a <= MAX_CELLS and 0 <= count_b <= MAX_CELLS):
+        return UNKNOWN, UNKNOWN, UNKNOWN
+    result = get_table()[index(only_a, both, only_b, count_a, count_b)]
+    return result & 3, (result >> 2) & 3, result >> 4
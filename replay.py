@@ -0,0 +1,341 @@
+import copy
+import json
+import random
+import time
+
+from minesweeper import Minesweeper, MinesweeperAI
+
+# Reasons a move can be recorded with
+REASONS = ("safe", "random", "flag")
+
+# Number of moves between checkpoints kept by the replayer
+CHECKPOINT_INTERVAL = 25
+
+
+class GameRecorder:
+    """
+    Streams games to a JSONL log as they are played.
+
+    Each game is written as a header line with the seed and board parameters, one line
+    per move with its reason and the time since the game started, and a final result
+    line. Every line is flushed as soon as it is written, so a log is readable even if
+    the process is interrupted mid-game.
+
+    Attributes:
+        file (file): The file the log is written to.
+        start_time (float): The time the current game started, from time.perf_counter().
+    """
+
+    def __init__(self, path):
+        """
+        Opens a log for writing, appending to it if it already exists.
+
+        Args:
+            path (str): The path of the log file.
+        """
+        self.file = open(path, "a")
+        self.start_time = None
+
+    def __enter__(self):
+        """
+        Returns the recorder for use in a with statement.
+
+        Returns:
+            GameRecorder: This recorder.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes the log file when leaving a with statement.
+        """
+        self.close()
+
+    def close(self):
+        """
+        Closes the log file.
+        """
+        self.file.close()
+
+    def write(self, entry):
+        """
+        Writes a single entry to the log and flushes it.
+
+        Args:
+            entry (dict): The entry to write.
+        """
+        self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def start_game(self, seed, height, width, mines):
+        """
+        Records the start of a new game.
+
+        Args:
+            seed (int): The seed used to place the mines.
+            height (int): The height of the game board.
+            width (int): The width of the game board.
+            mines (int): The number of mines on the board.
+        """
+        self.start_time = time.perf_counter()
+        self.write({"seed": seed, "height": height, "width": width, "mines": mines})
+
+    def record_move(self, cell, reason):
+        """
+        Records a move made in the current game.
+
+        Args:
+            cell (tuple): The coordinates (i, j) of the cell that was revealed or flagged.
+            reason (str): Why the move was made ('safe', 'random' or 'flag').
+        """
+        elapsed = round(time.perf_counter() - self.start_time, 6)
+        self.write({"move": list(cell), "reason": reason, "time": elapsed})
+
+    def end_game(self, won):
+        """
+        Records the result of the current game.
+
+        Args:
+            won (bool): True if the game was won, False otherwise.
+        """
+        self.write({"result": "won" if won else "lost"})
+        self.start_time = None
+
+
+def is_int(value):
+    """
+    Checks if a value read from a log is an integer.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        bool: True if the value is an int (and not a bool), False otherwise.
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def load_games(path):
+    """
+    Reads every game from a log written by GameRecorder.
+
+    Args:
+        path (str): The path of the log file.
+
+    Returns:
+        list of dicts: One dict per game with the keys of its header line, a 'moves'
+            list of (cell, reason, time) tuples, and a 'result' that is None if the
+            game was not finished when the log was written.
+
+    Raises:
+        ValueError: If the log is not valid JSONL or an entry is malformed.
+    """
+    games = []
+    with open(path) as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict):
+                raise ValueError(f"line {number}: expected a JSON object")
+
+            if "seed" in entry:
+                for key in ("seed", "height", "width", "mines"):
+                    if not is_int(entry.get(key)):
+                        raise ValueError(f"line {number}: '{key}' must be an integer")
+                if entry["height"] < 1 or entry["width"] < 1:
+                    raise ValueError(f"line {number}: the board must be at least 1x1")
+                if not 0 <= entry["mines"] < entry["height"] * entry["width"]:
+                    raise ValueError(f"line {number}: invalid number of mines")
+                entry["moves"] = []
+                entry["result"] = None
+                games.append(entry)
+            elif not games:
+                raise ValueError(f"{path} does not start with a game header")
+            elif "move" in entry:
+                game = games[-1]
+                move = entry["move"]
+                if not (
+                    isinstance(move, list)
+                    and len(move) == 2
+                    and all(is_int(value) for value in move)
+                    and 0 <= move[0] < game["height"]
+                    and 0 <= move[1] < game["width"]
+                ):
+                    raise ValueError(f"line {number}: invalid move {move}")
+                if entry.get("reason") not in REASONS:
+                    raise ValueError(
+                        f"line {number}: unknown move reason {entry.get('reason')}"
+                    )
+                elapsed = entry.get("time")
+                if not isinstance(elapsed, (int, float)) or isinstance(elapsed, bool):
+                    raise ValueError(f"line {number}: 'time' must be a number")
+                game["moves"].append((tuple(move), entry["reason"], elapsed))
+            elif "result" in entry:
+                if entry["result"] not in ("won", "lost"):
+                    raise ValueError(f"line {number}: unknown result {entry['result']}")
+                games[-1]["result"] = entry["result"]
+            else:
+                raise ValueError(f"line {number}: unknown entry")
+    return games
+
+
+class ReplayState:
+    """
+    Represents the state of a game at some point during a replay.
+
+    Attributes:
+        game (Minesweeper): The game being replayed.
+        ai (MinesweeperAI): The AI's knowledge after the moves applied so far.
+        revealed (set of tuples): The cells that have been revealed.
+        flags (set of tuples): The cells that have been flagged.
+        lost (bool): True if a mine has been revealed.
+        index (int): The number of moves applied so far.
+    """
+
+    def __init__(self, game, ai):
+        """
+        Initializes the state of a game before any moves are made.
+
+        Args:
+            game (Minesweeper): The game being replayed.
+            ai (MinesweeperAI): A fresh AI for the game.
+        """
+        self.game = game
+        self.ai = ai
+        self.revealed = set()
+        self.flags = set()
+        self.lost = False
+        self.index = 0
+
+    def copy(self):
+        """
+        Copies the state. The game itself is never modified, so it is shared.
+
+        Returns:
+            ReplayState: An independent copy of the state.
+        """
+        state = ReplayState(self.game, copy.deepcopy(self.ai))
+        state.revealed = set(self.revealed)
+        state.flags = set(self.flags)
+        state.lost = self.lost
+        state.index = self.index
+        return state
+
+    def apply(self, cell, reason):
+        """
+        Applies a single move to the game and the AI without rendering it.
+
+        Args:
+            cell (tuple): The coordinates (i, j) of the cell to reveal or flag.
+            reason (str): Why the move was made ('safe', 'random' or 'flag').
+        """
+        self.index += 1
+        if reason == "flag":
+            self.flags.add(cell)
+        elif self.game.is_mine(cell):
+            self.lost = True
+        else:
+            self.revealed.add(cell)
+            self.ai.add_knowledge(cell, self.game.nearby_mines(cell))
+
+
+class GameReplayer:
+    """
+    Replays a recorded game, keeping periodic checkpoints to jump to any move quickly.
+
+    Attributes:
+        seed (int): The seed used to place the mines.
+        height (int): The height of the game board.
+        width (int): The width of the game board.
+        mines (int): The number of mines on the board.
+        moves (list of tuples): The recorded (cell, reason, time) moves.
+        result (str): The recorded result ('won' or 'lost'), or None if unfinished.
+        checkpoint_interval (int): The number of moves between checkpoints.
+        checkpoints (dict): Maps move indexes to the ReplayState at that point.
+    """
+
+    def __init__(self, log, checkpoint_interval=CHECKPOINT_INTERVAL):
+        """
+        Prepares a recorded game for replay.
+
+        Args:
+            log (dict): A game as returned by load_games.
+            checkpoint_interval (int): The number of moves between checkpoints
+                (default is CHECKPOINT_INTERVAL).
+        """
+        self.seed = log["seed"]
+        self.height = log["height"]
+        self.width = log["width"]
+        self.mines = log["mines"]
+        self.moves = log["moves"]
+        self.result = log["result"]
+        self.checkpoint_interval = checkpoint_interval
+
+        self.checkpoints = {0: ReplayState(self.new_game(), self.new_ai())}
+
+    def __len__(self):
+        """
+        Counts the recorded moves.
+
+        Returns:
+            int: The number of moves in the recorded game.
+        """
+        return len(self.moves)
+
+    def new_game(self):
+        """
+        Recreates the recorded board from its seed, leaving the random number
+        generator as it was.
+
+        Returns:
+            Minesweeper: A new game with the same mines as the recorded one.
+        """
+        state = random.getstate()
+        random.seed(self.seed)
+        try:
+            return Minesweeper(height=self.height, width=self.width, mines=self.mines)
+        finally:
+            random.setstate(state)
+
+    def new_ai(self):
+        """
+        Creates a fresh AI for the recorded board.
+
+        Returns:
+            MinesweeperAI: A new AI with no knowledge.
+        """
+        return MinesweeperAI(height=self.height, width=self.width)
+
+    def seek(self, n):
+        """
+        Jumps to the state of the game after its first n moves.
+
+        Starts from the closest checkpoint at or before move n and applies the
+        remaining moves, saving new checkpoints along the way.
+
+        Args:
+            n (int): The number of moves to apply.
+
+        Returns:
+            ReplayState: The state after n moves, which the caller is free to modify.
+        """
+        if not 0 <= n <= len(self.moves):
+            raise ValueError(f"Move {n} is out of range (0 to {len(self.moves)})")
+
+        start = max(index for index in self.checkpoints if index <= n)
+        state = self.checkpoints[start].copy()
+        for cell, reason, _ in self.moves[start:n]:
+            state.apply(cell, reason)
+            if state.index % self.checkpoint_interval == 0:
+                self.checkpoints.setdefault(state.index, state.copy())
+        return state
+
+    def fast_forward(self):
+        """
+        Applies every recorded move.
+
+        Returns:
+            ReplayState: The state at the end of the game.
+        """
+        return self.seek(len(self.moves))
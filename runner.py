@@ -1,4 +1,5 @@
 import pygame
+import random
 import sys
 import time
 
@@ -17,6 +18,16 @@ WIDTH = 8
 HEIGHT = 8
 MINES = 10
 
+# Window and layout settings
+size = width, height = 1000, 800
+BOARD_PADDING = 20
+board_origin = (BOARD_PADDING, BOARD_PADDING)
+
+# Asset paths
+OPEN_SANS = "assets/fonts/OpenSans-Regular.ttf"
+FLAG_IMAGE = "assets/images/flag.png"
+MINE_IMAGE = "assets/images/mine.png"
+
 
 def set_difficulty(level):
     """
@@ -25,9 +36,10 @@ def set_difficulty(level):
     Args:
         level (str): The difficulty level ('easy', 'medium', 'hard').
     """
-    global WIDTH, HEIGHT, MINES
+    global WIDTH, HEIGHT, MINES, replayer
     difficulties = {"easy": (8, 8, 10), "medium": (16, 16, 40), "hard": (24, 24, 99)}
     WIDTH, HEIGHT, MINES = difficulties[level]
+    replayer = None  # Choosing a difficulty ends any replay
     reset_game()
 
 
@@ -35,13 +47,21 @@ def reset_game():
     """
     Resets the game state, including the game board, AI, and timer.
     Adjusts the size of the game elements based on the current difficulty.
+    When replaying a recorded game, jumps back to the move the replay started from.
     """
     global game, ai, revealed, flags, lost, start_time, cell_size, flag, mine, game_active
-    game = Minesweeper(height=HEIGHT, width=WIDTH, mines=MINES)
-    ai = MinesweeperAI(height=HEIGHT, width=WIDTH)
-    revealed = set()
-    flags = set()
-    lost = False
+    global replay_index
+    if replayer is not None:
+        state = replayer.seek(replay_start)
+        game, ai = state.game, state.ai
+        revealed, flags, lost = state.revealed, state.flags, state.lost
+        replay_index = state.index
+    else:
+        game = Minesweeper(height=HEIGHT, width=WIDTH, mines=MINES)
+        ai = MinesweeperAI(height=HEIGHT, width=WIDTH)
+        revealed = set()
+        flags = set()
+        lost = False
     game_active = True
     start_time = pygame.time.get_ticks()  # Reset the timer
 
@@ -77,250 +97,301 @@ def draw_button(button_rect, text, center_pos, screen, font):
     screen.blit(buttonText, buttonTextRect)
 
 
-# Pygame initialization
-pygame.init()
-size = width, height = 1000, 800
-screen = pygame.display.set_mode(size)
+def main(settings=None, seed=None, replay=None, start=0):
+    """
+    Opens the game window and runs the Pygame event loop.
 
-# Set the window title
-pygame.display.set_caption("Minesweeper")
+    Args:
+        settings (tuple): Optional (height, width, mines) board settings. When given,
+            the game starts directly on the board instead of the main menu.
+        seed (int): Optional seed for the random number generator used to place mines.
+        replay (GameReplayer): Optional recorded game to play back. The AI Move button
+            then steps through the recorded moves instead of asking the AI.
+        start (int): The move to start playing back from (default is 0).
+    """
+    global HEIGHT, WIDTH, MINES, replayer, replay_start, replay_index
+    global flags, lost, start_time, cell_size, flag, mine, game_active
 
-# Initialize timer
-start_time = pygame.time.get_ticks()
+    # Play back a recorded game on its own board
+    replayer = replay
+    replay_start = start
+    if replayer is not None:
+        settings = (replayer.height, replayer.width, replayer.mines)
 
-# Fonts
-OPEN_SANS = "assets/fonts/OpenSans-Regular.ttf"
-smallFont = pygame.font.Font(OPEN_SANS, 20)
-mediumFont = pygame.font.Font(OPEN_SANS, 28)
-largeFont = pygame.font.Font(OPEN_SANS, 62)
+    if seed is not None:
+        random.seed(seed)
 
-# Compute board size
-BOARD_PADDING = 20
-board_width = ((2 / 3) * width) - (BOARD_PADDING * 2)
-board_height = height - (BOARD_PADDING * 2)
-cell_size = int(min(board_width / WIDTH, board_height / HEIGHT))
-board_origin = (BOARD_PADDING, BOARD_PADDING)
+    # Pygame initialization
+    pygame.init()
+    screen = pygame.display.set_mode(size)
 
-# Add images
-flag = pygame.image.load("assets/images/flag.png")
-flag = pygame.transform.scale(flag, (cell_size, cell_size))
-mine = pygame.image.load("assets/images/mine.png")
-mine = pygame.transform.scale(mine, (cell_size, cell_size))
-
-# Create game and AI agent, initialize game state variables
-reset_game()
-
-# Show instructions initially
-instructions = True
-
-while True:
-    # Main game loop
-    # Handling quitting the game
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            sys.exit()
-
-    screen.fill(BG_COLOR)
-
-    # Show game instructions
-    if instructions:
-        # Title
-        title = largeFont.render("Minesweeper", True, WHITE)
-        titleRect = title.get_rect()
-        titleRect.center = ((width / 2), 80)
-        screen.blit(title, titleRect)
-
-        # Rules
-        rules = [
-            "Click on a cell to reveal it, or right-click to mark it as a mine.",
-            "Mark every cell with a mine to win, but uncover a mine and you lose!",
-            "Choose a difficulty below to begin playing.",
-        ]
-        for i, rule in enumerate(rules):
-            line = smallFont.render(rule, True, WHITE)
-            lineRect = line.get_rect()
-            lineRect.center = ((width / 2), 160 + 50 * i)
-            screen.blit(line, lineRect)
-
-        # Difficulty buttons
-        difficulty_levels = ["easy", "medium", "hard"]
-        for i, level in enumerate(difficulty_levels):
-            buttonRect = pygame.Rect((width / 4), 350 + 70 * i, width / 2, 50)
-            center_pos = (width / 2, 350 + 70 * i + 25)
-            draw_button(buttonRect, level.capitalize(), center_pos, screen, mediumFont)
-
-            # Check if difficulty button is clicked
-            click, _, _ = pygame.mouse.get_pressed()
-            if click == 1:
-                mouse = pygame.mouse.get_pos()
-                if buttonRect.collidepoint(mouse):
-                    set_difficulty(level)
-                    instructions = False
-                    time.sleep(0.3)
+    # Set the window title
+    pygame.display.set_caption("Minesweeper")
 
-        pygame.display.flip()
-        continue
-
-    # Draw board
-    cells = []
-    for i in range(HEIGHT):
-        row = []
-        for j in range(WIDTH):
-            # Draw rectangle for cell
-            rect = pygame.Rect(
-                board_origin[0] + j * cell_size,
-                board_origin[1] + i * cell_size,
-                cell_size,
-                cell_size,
-            )
-            pygame.draw.rect(screen, GRAY, rect)
-            pygame.draw.rect(screen, WHITE, rect, 3)
-
-            # Add a mine, flag, or number if needed
-            if game.is_mine((i, j)) and lost:
-                screen.blit(mine, rect)
-            elif (i, j) in flags:
-                screen.blit(flag, rect)
-            elif (i, j) in revealed:
-                neighbors = smallFont.render(
-                    str(game.nearby_mines((i, j))), True, BLACK
+    # Initialize timer
+    start_time = pygame.time.get_ticks()
+
+    # Fonts
+    smallFont = pygame.font.Font(OPEN_SANS, 20)
+    mediumFont = pygame.font.Font(OPEN_SANS, 28)
+    largeFont = pygame.font.Font(OPEN_SANS, 62)
+
+    # Compute board size
+    if settings is not None:
+        HEIGHT, WIDTH, MINES = settings
+    board_width = ((2 / 3) * width) - (BOARD_PADDING * 2)
+    board_height = height - (BOARD_PADDING * 2)
+    cell_size = int(min(board_width / WIDTH, board_height / HEIGHT))
+
+    # Add images
+    flag = pygame.image.load(FLAG_IMAGE)
+    flag = pygame.transform.scale(flag, (cell_size, cell_size))
+    mine = pygame.image.load(MINE_IMAGE)
+    mine = pygame.transform.scale(mine, (cell_size, cell_size))
+
+    # Create game and AI agent, initialize game state variables
+    reset_game()
+
+    # Show instructions initially, unless board settings were given
+    instructions = settings is None
+
+    while True:
+        # Main game loop
+        # Handling quitting the game
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                sys.exit()
+
+        screen.fill(BG_COLOR)
+
+        # Show game instructions
+        if instructions:
+            # Title
+            title = largeFont.render("Minesweeper", True, WHITE)
+            titleRect = title.get_rect()
+            titleRect.center = ((width / 2), 80)
+            screen.blit(title, titleRect)
+
+            # Rules
+            rules = [
+                "Click on a cell to reveal it, or right-click to mark it as a mine.",
+                "Mark every cell with a mine to win, but uncover a mine and you lose!",
+                "Choose a difficulty below to begin playing.",
+            ]
+            for i, rule in enumerate(rules):
+                line = smallFont.render(rule, True, WHITE)
+                lineRect = line.get_rect()
+                lineRect.center = ((width / 2), 160 + 50 * i)
+                screen.blit(line, lineRect)
+
+            # Difficulty buttons
+            difficulty_levels = ["easy", "medium", "hard"]
+            for i, level in enumerate(difficulty_levels):
+                buttonRect = pygame.Rect((width / 4), 350 + 70 * i, width / 2, 50)
+                center_pos = (width / 2, 350 + 70 * i + 25)
+                draw_button(
+                    buttonRect, level.capitalize(), center_pos, screen, mediumFont
                 )
-                neighborsTextRect = neighbors.get_rect()
-                neighborsTextRect.center = rect.center
-                screen.blit(neighbors, neighborsTextRect)
-
-            row.append(rect)
-        cells.append(row)
-
-    # Draw AI Move, Reset, and Main Menu buttons
-    ai_button_rect = pygame.Rect(
-        (2 / 3) * width + BOARD_PADDING,
-        (1 / 3) * height - 50,
-        (width / 3) - BOARD_PADDING * 2,
-        50,
-    )
-    reset_button_rect = pygame.Rect(
-        (2 / 3) * width + BOARD_PADDING,
-        (1 / 3) * height + 20,
-        (width / 3) - BOARD_PADDING * 2,
-        50,
-    )
-    main_menu_button_rect = pygame.Rect(
-        (2 / 3) * width + BOARD_PADDING,
-        (1 / 3) * height + 90,
-        (width / 3) - BOARD_PADDING * 2,
-        50,
-    )
-
-    draw_button(ai_button_rect, "AI Move", ai_button_rect.center, screen, mediumFont)
-    draw_button(
-        reset_button_rect, "Reset", reset_button_rect.center, screen, mediumFont
-    )
-    draw_button(
-        main_menu_button_rect,
-        "Main Menu",
-        main_menu_button_rect.center,
-        screen,
-        mediumFont,
-    )
-
-    # Check if the game is lost or won
-    if lost or game.mines == flags:
-        game_active = False
-
-    # Display text
-    text = "You lost!" if lost else "You won!" if game.mines == flags else ""
-    text = mediumFont.render(text, True, WHITE)
-    textRect = text.get_rect()
-    textRect.center = ((5 / 6) * width, (2 / 3) * height)
-    screen.blit(text, textRect)
-
-    move = None
-
-    left, _, right = pygame.mouse.get_pressed()
-
-    # Update and display timer only if the game is still active
-    if game_active:
-        current_time = pygame.time.get_ticks()
-        elapsed_time = (current_time - start_time) // 1000
-        timer_surface = smallFont.render(f"Time elapsed: {elapsed_time} s", True, WHITE)
-    else:
-        # If game is not active, just render the final time
-        timer_surface = smallFont.render(f"Final time: {elapsed_time} s", True, WHITE)
-
-    timer_rect = timer_surface.get_rect()
-    timer_rect.topleft = ((2 / 3) * width + BOARD_PADDING, 20)
-    screen.blit(timer_surface, timer_rect)
-
-    # Display mine counter
-    mines_left = MINES - len(flags)
-    mine_counter_surface = smallFont.render(
-        f"Mines left to mark: {mines_left}", True, WHITE
-    )
-    mine_counter_rect = mine_counter_surface.get_rect()
-    mine_counter_rect.topleft = (
-        (2 / 3) * width + BOARD_PADDING,
-        70,
-    )
-    screen.blit(mine_counter_surface, mine_counter_rect)
-
-    # Check for a right-click to toggle flagging
-    if right == 1 and not lost:
-        mouse = pygame.mouse.get_pos()
+
+                # Check if difficulty button is clicked
+                click, _, _ = pygame.mouse.get_pressed()
+                if click == 1:
+                    mouse = pygame.mouse.get_pos()
+                    if buttonRect.collidepoint(mouse):
+                        set_difficulty(level)
+                        instructions = False
+                        time.sleep(0.3)
+
+            pygame.display.flip()
+            continue
+
+        # Draw board
+        cells = []
         for i in range(HEIGHT):
+            row = []
             for j in range(WIDTH):
-                if cells[i][j].collidepoint(mouse) and (i, j) not in revealed:
-                    if (i, j) in flags:
-                        flags.remove((i, j))
-                    else:
-                        flags.add((i, j))
-                    time.sleep(0.2)
+                # Draw rectangle for cell
+                rect = pygame.Rect(
+                    board_origin[0] + j * cell_size,
+                    board_origin[1] + i * cell_size,
+                    cell_size,
+                    cell_size,
+                )
+                pygame.draw.rect(screen, GRAY, rect)
+                pygame.draw.rect(screen, WHITE, rect, 3)
+
+                # Add a mine, flag, or number if needed
+                if game.is_mine((i, j)) and lost:
+                    screen.blit(mine, rect)
+                elif (i, j) in flags:
+                    screen.blit(flag, rect)
+                elif (i, j) in revealed:
+                    neighbors = smallFont.render(
+                        str(game.nearby_mines((i, j))), True, BLACK
+                    )
+                    neighborsTextRect = neighbors.get_rect()
+                    neighborsTextRect.center = rect.center
+                    screen.blit(neighbors, neighborsTextRect)
+
+                row.append(rect)
+            cells.append(row)
+
+        # Draw AI Move, Reset, and Main Menu buttons
+        ai_button_rect = pygame.Rect(
+            (2 / 3) * width + BOARD_PADDING,
+            (1 / 3) * height - 50,
+            (width / 3) - BOARD_PADDING * 2,
+            50,
+        )
+        reset_button_rect = pygame.Rect(
+            (2 / 3) * width + BOARD_PADDING,
+            (1 / 3) * height + 20,
+            (width / 3) - BOARD_PADDING * 2,
+            50,
+        )
+        main_menu_button_rect = pygame.Rect(
+            (2 / 3) * width + BOARD_PADDING,
+            (1 / 3) * height + 90,
+            (width / 3) - BOARD_PADDING * 2,
+            50,
+        )
+
+        draw_button(
+            ai_button_rect,
+            "AI Move" if replayer is None else "Next Move",
+            ai_button_rect.center,
+            screen,
+            mediumFont,
+        )
+        draw_button(
+            reset_button_rect, "Reset", reset_button_rect.center, screen, mediumFont
+        )
+        draw_button(
+            main_menu_button_rect,
+            "Main Menu",
+            main_menu_button_rect.center,
+            screen,
+            mediumFont,
+        )
+
+        # Check if the game is lost or won
+        if lost or game.mines == flags:
+            game_active = False
+
+        # Display text
+        text = "You lost!" if lost else "You won!" if game.mines == flags else ""
+        text = mediumFont.render(text, True, WHITE)
+        textRect = text.get_rect()
+        textRect.center = ((5 / 6) * width, (2 / 3) * height)
+        screen.blit(text, textRect)
+
+        move = None
+
+        left, _, right = pygame.mouse.get_pressed()
+
+        # Update and display timer only if the game is still active
+        if game_active:
+            current_time = pygame.time.get_ticks()
+            elapsed_time = (current_time - start_time) // 1000
+            timer_surface = smallFont.render(
+                f"Time elapsed: {elapsed_time} s", True, WHITE
+            )
+        else:
+            # If game is not active, just render the final time
+            timer_surface = smallFont.render(
+                f"Final time: {elapsed_time} s", True, WHITE
+            )
 
-    elif left == 1:
-        mouse = pygame.mouse.get_pos()
+        timer_rect = timer_surface.get_rect()
+        timer_rect.topleft = ((2 / 3) * width + BOARD_PADDING, 20)
+        screen.blit(timer_surface, timer_rect)
+
+        # Display mine counter
+        mines_left = MINES - len(flags)
+        mine_counter_surface = smallFont.render(
+            f"Mines left to mark: {mines_left}", True, WHITE
+        )
+        mine_counter_rect = mine_counter_surface.get_rect()
+        mine_counter_rect.topleft = (
+            (2 / 3) * width + BOARD_PADDING,
+            70,
+        )
+        screen.blit(mine_counter_surface, mine_counter_rect)
+
+        # Check for a right-click to toggle flagging, unless replaying a recorded game
+        if right == 1 and replayer is None and not lost:
+            mouse = pygame.mouse.get_pos()
+            for i in range(HEIGHT):
+                for j in range(WIDTH):
+                    if cells[i][j].collidepoint(mouse) and (i, j) not in revealed:
+                        if (i, j) in flags:
+                            flags.remove((i, j))
+                        else:
+                            flags.add((i, j))
+                        time.sleep(0.2)
+
+        elif left == 1:
+            mouse = pygame.mouse.get_pos()
+
+            # If AI button clicked while replaying, make the next recorded move
+            if ai_button_rect.collidepoint(mouse) and replayer is not None and not lost:
+                if replay_index < len(replayer):
+                    move, reason, _ = replayer.moves[replay_index]
+                    replay_index += 1
+                    print(f"Replaying move {replay_index}/{len(replayer)}: {reason}.")
+                    if reason == "flag":
+                        flags.add(move)
+                        move = None
+                else:
+                    print("No moves left to replay.")
+                time.sleep(0.2)
 
-        # If AI button clicked, make an AI move
-        if ai_button_rect.collidepoint(mouse) and not lost:
-            move = ai.make_safe_move()
-            if move is None:
-                move = ai.make_random_move()
+            # If AI button clicked, make an AI move
+            elif ai_button_rect.collidepoint(mouse) and not lost:
+                move = ai.make_safe_move()
                 if move is None:
-                    flags = ai.mines.copy()
-                    print("No moves left to make.")
+                    move = ai.make_random_move()
+                    if move is None:
+                        flags = ai.mines.copy()
+                        print("No moves left to make.")
+                    else:
+                        print("No known safe moves, AI making random move.")
                 else:
-                    print("No known safe moves, AI making random move.")
+                    print("AI making safe move.")
+                time.sleep(0.2)
+
+            # Reset game state
+            elif reset_button_rect.collidepoint(mouse):
+                reset_game()
+                continue
+
+            # Return to main menu
+            elif main_menu_button_rect.collidepoint(mouse):
+                instructions = True
+                continue
+
+            # User-made move, unless replaying a recorded game
+            elif replayer is None and not lost:
+                for i in range(HEIGHT):
+                    for j in range(WIDTH):
+                        if (
+                            cells[i][j].collidepoint(mouse)
+                            and (i, j) not in flags
+                            and (i, j) not in revealed
+                        ):
+                            move = (i, j)
+
+        # Make move and update AI knowledge
+        if move:
+            if game.is_mine(move):
+                lost = True
             else:
-                print("AI making safe move.")
-            time.sleep(0.2)
-
-        # Reset game state
-        elif reset_button_rect.collidepoint(mouse):
-            reset_game()
-            continue
+                nearby = game.nearby_mines(move)
+                revealed.add(move)
+                ai.add_knowledge(move, nearby)
 
-        # Return to main menu
-        elif main_menu_button_rect.collidepoint(mouse):
-            instructions = True
-            continue
+        pygame.display.flip()
 
-        # User-made move
-        elif not lost:
-            for i in range(HEIGHT):
-                for j in range(WIDTH):
-                    if (
-                        cells[i][j].collidepoint(mouse)
-                        and (i, j) not in flags
-                        and (i, j) not in revealed
-                    ):
-                        move = (i, j)
-
-    # Make move and update AI knowledge
-    if move:
-        if game.is_mine(move):
-            lost = True
-        else:
-            nearby = game.nearby_mines(move)
-            revealed.add(move)
-            ai.add_knowledge(move, nearby)
 
-    pygame.display.flip()
+if __name__ == "__main__":
+    main()